@@ -197,8 +197,9 @@ class PyPackagerApp:
         except ImportError:
             pass  # Use default theme if ttkthemes is not installed
         
-        # Initialize managers
-        self.repository_manager = RepositoryManager()
+        # Initialize managers; the repository manager is created when the
+        # repositories window is first opened
+        self._repository_manager = None
         self.dependency_resolver = DependencyResolver()
         
         # Create menu
@@ -229,6 +230,13 @@ class PyPackagerApp:
         # Load settings from file
         self.load_settings()
         
+    @property
+    def repository_manager(self):
+        """Repository manager, loaded from disk on first use."""
+        if self._repository_manager is None:
+            self._repository_manager = RepositoryManager()
+        return self._repository_manager
+    
     def create_widgets(self):
         """Create the main application widgets."""
         # Main container - using tk.PanedWindow for better control
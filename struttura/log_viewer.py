@@ -1,35 +1,86 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import os
+import re
 from .lang import tr
 
 LOG_FILE = 'traceback.log'
 LOG_LEVELS = ["ALL", "INFO", "WARNING", "ERROR"]
 
+# Precompiled "[LEVEL]" matchers, one per filterable level
+_LEVEL_RE = {level: re.compile(re.escape(f"[{level}]")) for level in LOG_LEVELS if level != "ALL"}
+
+# Only the tail of larger logs is loaded into the viewer
+MAX_LOG_BYTES = 2 * 1024 * 1024
+# At most this many of the most recent matching lines are shown
+MAX_DISPLAY_LINES = 10000
+
+# Lines from the last read, reused while the file's mtime and size are unchanged
+_log_cache = {"mtime": None, "size": None, "lines": []}
+
+def load_log_lines():
+    """
+    Return the lines of the log file, keeping their line endings.
+    The file is only re-read when it changed since the previous call, and
+    only its last MAX_LOG_BYTES are read.
+    """
+    try:
+        st = os.stat(LOG_FILE)
+    except FileNotFoundError:
+        return []
+    if (st.st_mtime_ns, st.st_size) == (_log_cache["mtime"], _log_cache["size"]):
+        return _log_cache["lines"]
+    offset = max(0, st.st_size - MAX_LOG_BYTES)
+    with open(LOG_FILE, 'rb') as f:
+        if offset:
+            # Skip the partial line the tail starts in; starting one byte
+            # early keeps a line that begins exactly at the offset
+            f.seek(offset - 1)
+            f.readline()
+        data = f.read()
+    lines = data.decode('utf-8', errors='replace').splitlines(keepends=True)
+    _log_cache.update(mtime=st.st_mtime_ns, size=st.st_size, lines=lines)
+    return lines
+
+# Per-level results for the last list of lines filtered
+_filter_cache = {"lines": None, "by_level": {}}
+
+def filter_lines(lines, level):
+    """
+    Return the lines matching a log level ("ALL" returns every line).
+    Results are kept per level until a different list of lines is passed,
+    so switching back and forth between filters doesn't rescan the log.
+    """
+    if level == "ALL":
+        return lines
+    if _filter_cache["lines"] is not lines:
+        _filter_cache.update(lines=lines, by_level={})
+    by_level = _filter_cache["by_level"]
+    filtered = by_level.get(level)
+    if filtered is None:
+        filtered = by_level[level] = list(filter(_LEVEL_RE[level].search, lines))
+    return filtered
+
 class LogViewer:
     """
     A dialog to view the application log file with filtering by log level.
     """
-    @staticmethod
-    def show_log(root):
-        def load_log_lines():
-            if not os.path.exists(LOG_FILE):
-                return []
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                return f.readlines()
-
-        def filter_lines(lines, level):
-            if level == "ALL":
-                return lines
-            filtered = []
-            for line in lines:
-                if f"[{level}]" in line:
-                    filtered.append(line)
-            return filtered
+    # The window is built once, hidden on close and shown again on reuse
+    _window = None
+    _refresh = None
+    _closed = None
+
+    @classmethod
+    def show_log(cls, root):
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.deiconify()
+            cls._refresh()
+            cls._show_modal(root)
+            return
 
         def update_display():
             lines = load_log_lines()
-            filtered = filter_lines(lines, selected_level.get())
+            filtered = filter_lines(lines, selected_level.get())[-MAX_DISPLAY_LINES:]
             text_area.config(state=tk.NORMAL)
             text_area.delete(1.0, tk.END)
             if filtered:
@@ -41,6 +92,21 @@ class LogViewer:
         def on_filter_change():
             update_display()
 
+        def hide():
+            log_window.grab_release()
+            log_window.withdraw()
+            cls._closed.set(True)
+
+        def on_destroy(event):
+            # Release a pending _show_modal() if the main window takes us down
+            if event.widget is not log_window:
+                return
+            cls._window = None
+            try:
+                cls._closed.set(True)
+            except tk.TclError:
+                pass
+
         log_window = tk.Toplevel(root)
         log_window.title(tr('log_viewer_title'))
         log_window.geometry('700x500')
@@ -61,9 +127,20 @@ class LogViewer:
         update_display()
 
         # Close button
-        close_btn = ttk.Button(log_window, text=tr('close'), command=log_window.destroy)
+        close_btn = ttk.Button(log_window, text=tr('close'), command=hide)
         close_btn.pack(pady=10)
+        log_window.protocol('WM_DELETE_WINDOW', hide)
+        log_window.bind('<Destroy>', on_destroy)
 
         log_window.transient(root)
-        log_window.grab_set()
-        root.wait_window(log_window)
+        cls._window = log_window
+        cls._refresh = update_display
+        cls._closed = tk.BooleanVar(master=log_window)
+        cls._show_modal(root)
+
+    @classmethod
+    def _show_modal(cls, root):
+        """Grab input for the viewer and wait until it is hidden again."""
+        cls._closed.set(False)
+        cls._window.grab_set()
+        root.wait_variable(cls._closed)
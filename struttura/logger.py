@@ -1,35 +1,83 @@
-import datetime
+import logging
+import os
 import sys
-import threading
+import time
+from logging.handlers import RotatingFileHandler
 
+# Read-only: the handler below is bound to this path at import, so
+# reassigning LOG_FILE later does not redirect the log
 LOG_FILE = 'traceback.log'
 LOG_LEVELS = ("INFO", "WARNING", "ERROR")
+# traceback.log is rotated once it reaches LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old files
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
 
-_log_lock = threading.Lock()
+# (second, formatted timestamp) of the last entry; entries logged within
+# the same second reuse the formatted string
+_timestamp_cache = (None, "")
 
-def _write_log(level, message):
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] [{level}] {message}\n"
-    with _log_lock:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+def _timestamp(created):
+    global _timestamp_cache
+    now = int(created)
+    second, formatted = _timestamp_cache
+    if now != second:
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+class _LogFormatter(logging.Formatter):
+    def formatTime(self, record, datefmt=None):
+        return _timestamp(record.created)
+
+class _LogFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that also reopens the log if it was deleted or
+    moved by something other than the handler itself.
+
+    The check costs two stat calls, so it runs at most once per second of
+    record time rather than on every record.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checked_second = None
+
+    def emit(self, record):
+        second = int(record.created)
+        if second != self._checked_second:
+            # A stream that is not open yet is opened fresh below
+            self._checked_second = second
+            if self.stream is not None:
+                try:
+                    st = os.stat(self.baseFilename)
+                    fst = os.fstat(self.stream.fileno())
+                    reopen = (st.st_dev, st.st_ino) != (fst.st_dev, fst.st_ino)
+                except OSError:
+                    reopen = True
+                if reopen:
+                    self.stream.close()
+                    self.stream = None
+        super().emit(record)
+
+_handler = _LogFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                           encoding='utf-8', delay=True)
+_handler.setFormatter(_LogFormatter('[%(asctime)s] [%(levelname)s] %(message)s'))
+
+_logger = logging.getLogger(__name__)
+_logger.setLevel(logging.INFO)
+_logger.addHandler(_handler)
+_logger.propagate = False
 
 def log_info(message):
-    _write_log("INFO", message)
+    _logger.info(message)
 
 def log_warning(message):
-    _write_log("WARNING", message)
+    _logger.warning(message)
 
 def log_error(message):
-    _write_log("ERROR", message)
+    _logger.error(message)
 
 def log_exception(exc_type, exc_value, exc_tb):
-    import traceback
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    with _log_lock:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"\n[{timestamp}] [ERROR] Uncaught exception:\n")
-            traceback.print_exception(exc_type, exc_value, exc_tb, file=f)
+    _logger.error("Uncaught exception:", exc_info=(exc_type, exc_value, exc_tb))
 
 def setup_global_exception_logging():
     sys.excepthook = log_exception
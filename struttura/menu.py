@@ -3,30 +3,28 @@ import platform
 import subprocess
 import os
 import webbrowser
+from functools import partial
 from tkinter import messagebox
 import sys
 import os
 
-# Use absolute imports
-from struttura.about import About
-from struttura.help import Help
-from struttura.sponsor import Sponsor
-from struttura.log_viewer import LogViewer
-from struttura.version import show_version
+# Use absolute imports. The dialogs opened from the menus are imported
+# when their entry is clicked, so they don't slow down showing the window.
 from struttura.lang import translator, tr, SUPPORTED_LANGUAGES
-from struttura.updates import check_for_updates
 
-def create_menu_bar(root, app):
-    menubar = tk.Menu(root)
-    root.config(menu=menubar)
+def _lazy_menu(menubar, populate):
+    """Create a submenu whose entries are only built the first time it is posted."""
+    def build():
+        menu.configure(postcommand='')
+        populate(menu)
+
+    menu = tk.Menu(menubar, tearoff=0, postcommand=build)
+    return menu
 
-    # File menu
-    file_menu = tk.Menu(menubar, tearoff=0)
+def _populate_file_menu(file_menu, root):
     file_menu.add_command(label=tr('exit'), command=root.quit)
-    menubar.add_cascade(label=tr('menu_file'), menu=file_menu)
 
-    # Edit menu
-    edit_menu = tk.Menu(menubar, tearoff=0)
+def _populate_edit_menu(edit_menu):
     edit_menu.add_command(label=tr('undo'), state='disabled')  # Will be connected to actual functionality
     edit_menu.add_command(label=tr('redo'), state='disabled')   # Will be connected to actual functionality
     edit_menu.add_separator()
@@ -34,10 +32,8 @@ def create_menu_bar(root, app):
     edit_menu.add_command(label=tr('copy'))
     edit_menu.add_command(label=tr('paste'))
     edit_menu.add_command(label=tr('delete'))
-    menubar.add_cascade(label=tr('menu_edit'), menu=edit_menu)
 
-    # View menu
-    view_menu = tk.Menu(menubar, tearoff=0)
+def _populate_view_menu(view_menu):
     view_menu.add_checkbutton(label=tr('toolbar'))
     view_menu.add_checkbutton(label=tr('status_bar'))
     view_menu.add_checkbutton(label=tr('console'))
@@ -45,16 +41,18 @@ def create_menu_bar(root, app):
     view_menu.add_command(label=tr('zoom_in'))
     view_menu.add_command(label=tr('zoom_out'))
     view_menu.add_command(label=tr('reset_zoom'))
-    menubar.add_cascade(label=tr('menu_view'), menu=view_menu)
 
-    # Tools menu
-    tools_menu = tk.Menu(menubar, tearoff=0)
+def _populate_tools_menu(tools_menu, root):
     tools_menu.add_command(
         label=tr('package_manager'),
-        command=lambda: webbrowser.open('https://packaging.python.org/en/latest/tutorials/packaging-projects/')
+        command=partial(webbrowser.open, 'https://packaging.python.org/en/latest/tutorials/packaging-projects/')
     )
     tools_menu.add_separator()
-    tools_menu.add_command(label=tr('view_log'), command=lambda: LogViewer.show_log(root))
+    def open_log():
+        from struttura.log_viewer import LogViewer
+        LogViewer.show_log(root)
+
+    tools_menu.add_command(label=tr('view_log'), command=open_log)
     def open_terminal():
         """Open a terminal window appropriate for the current OS."""
         try:
@@ -69,34 +67,61 @@ def create_menu_bar(root, app):
     
     tools_menu.add_command(label=tr('terminal'), command=open_terminal)
     tools_menu.add_separator()
-    tools_menu.add_command(label=tr('check_for_updates'), command=lambda: check_for_updates(root))
-    menubar.add_cascade(label=tr('menu_tools'), menu=tools_menu)
+    def open_updates():
+        from struttura.updates import check_for_updates
+        check_for_updates(root)
+
+    tools_menu.add_command(label=tr('check_for_updates'), command=open_updates)
 
-    # Language menu
+def _populate_language_menu(lang_menu, root):
     def set_lang_and_restart(lang_code):
         if translator.set_language(lang_code):
             root.destroy()
             os.execl(sys.executable, sys.executable, *sys.argv)
 
-    lang_menu = tk.Menu(menubar, tearoff=0)
     for code, label in SUPPORTED_LANGUAGES.items():
         lang_menu.add_command(
             label=label,
-            command=lambda c=code: set_lang_and_restart(c)
+            command=partial(set_lang_and_restart, code)
         )
-    menubar.add_cascade(label=tr('menu_language'), menu=lang_menu)
 
-    # Help menu
-    help_menu = tk.Menu(menubar, tearoff=0)
-    help_menu.add_command(label=tr('documentation'), command=lambda: Help.show_help(root))
-    help_menu.add_command(label=tr('report_issue'), command=lambda: webbrowser.open('https://github.com/Nsfr750/pack/issues'))
+def _populate_help_menu(help_menu, root):
+    def open_help():
+        from struttura.help import Help
+        Help.show_help(root)
+
+    def open_about():
+        from struttura.about import About
+        About.show_about(root)
+
+    def open_sponsor():
+        from struttura.sponsor import Sponsor
+        Sponsor(root).show_sponsor()
+
+    help_menu.add_command(label=tr('documentation'), command=open_help)
+    help_menu.add_command(label=tr('report_issue'), command=partial(webbrowser.open, 'https://github.com/Nsfr750/pack/issues'))
     help_menu.add_separator()
-    help_menu.add_command(label=tr('about'), command=lambda: About.show_about(root))
-    help_menu.add_command(label=tr('sponsor'), command=lambda: Sponsor(root).show_sponsor())
-    menubar.add_cascade(label=tr('menu_help'), menu=help_menu)
+    help_menu.add_command(label=tr('about'), command=open_about)
+    help_menu.add_command(label=tr('sponsor'), command=open_sponsor)
 
-    return menubar
+def create_menu_bar(root, app):
+    menubar = tk.Menu(root)
+    root.config(menu=menubar)
+
+    # Only the top-level cascades are created here; their entries are
+    # built the first time each submenu is opened
+    menubar.add_cascade(label=tr('menu_file'),
+                        menu=_lazy_menu(menubar, lambda m: _populate_file_menu(m, root)))
+    menubar.add_cascade(label=tr('menu_edit'), menu=_lazy_menu(menubar, _populate_edit_menu))
+    menubar.add_cascade(label=tr('menu_view'), menu=_lazy_menu(menubar, _populate_view_menu))
+    menubar.add_cascade(label=tr('menu_tools'),
+                        menu=_lazy_menu(menubar, lambda m: _populate_tools_menu(m, root)))
+    menubar.add_cascade(label=tr('menu_language'),
+                        menu=_lazy_menu(menubar, lambda m: _populate_language_menu(m, root)))
+    menubar.add_cascade(label=tr('menu_help'),
+                        menu=_lazy_menu(menubar, lambda m: _populate_help_menu(m, root)))
 
+    return menubar
 
 if __name__ == "__main__":
     # Test the menu
@@ -4,14 +4,53 @@ Handles both public and private package repositories.
 """
 import os
 import json
-import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-import subprocess
+from typing import Dict, List, Optional
 import logging
+from urllib.parse import quote, urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
+# keyring service name under which repository passwords are stored
+KEYRING_SERVICE = 'python_package_manager'
+
+_keyring_module = None
+
+def _get_keyring():
+    """Import keyring on first use; returns None if it is not installed."""
+    global _keyring_module
+    if _keyring_module is None:
+        try:
+            import keyring
+            _keyring_module = keyring
+        except ImportError:
+            _keyring_module = False
+    return _keyring_module or None
+
+def _keyring_user(url: str, username: str) -> str:
+    return f"{url}:{username}"
+
+def _load_password(url: str, username: str) -> Optional[str]:
+    """Look up a stored repository password in the system keyring."""
+    keyring = _get_keyring()
+    if keyring is None:
+        return None
+    try:
+        return keyring.get_password(KEYRING_SERVICE, _keyring_user(url, username))
+    except Exception as e:
+        logger.warning(f"Error reading password from keyring: {e}")
+        return None
+
+def _store_password(url: str, username: str, password: str) -> None:
+    """Store a repository password in the system keyring, if available."""
+    keyring = _get_keyring()
+    if keyring is None:
+        return
+    try:
+        keyring.set_password(KEYRING_SERVICE, _keyring_user(url, username), password)
+    except Exception as e:
+        logger.warning(f"Error saving password to keyring: {e}")
+
 class PackageRepository:
     """Represents a package repository (public or private)."""
     
@@ -31,16 +70,48 @@ class PackageRepository:
         self.username = username
         self.password = password
         self.is_default = is_default
+        # ((url, username, password), auth URL) of the last get_auth_url call
+        self._auth_url_cache = None
+    
+    @property
+    def password(self) -> Optional[str]:
+        """Password/token for authentication.
+        
+        When none was given, it is looked up in the system keyring the first
+        time it is needed.
+        """
+        if self._password is None and not self._password_looked_up and self.username:
+            self._password_looked_up = True
+            self._password = _load_password(self.url, self.username)
+        return self._password
+    
+    @password.setter
+    def password(self, value: Optional[str]) -> None:
+        self._password = value
+        self._password_looked_up = value is not None
+    
+    def store_password(self) -> None:
+        """Save a password set on this repository to the system keyring."""
+        if self._password and self.username:
+            _store_password(self.url, self.username, self._password)
     
     def get_auth_url(self) -> str:
-        """Get the URL with authentication if credentials are provided."""
+        """Get the URL with authentication if credentials are provided.
+        
+        Credentials are percent-encoded into the netloc of http(s) URLs.
+        """
+        key = (self.url, self.username, self.password)
+        if self._auth_url_cache is not None and self._auth_url_cache[0] == key:
+            return self._auth_url_cache[1]
+        
+        auth_url = self.url
         if self.username and self.password:
-            # Handle both http and https URLs
-            if self.url.startswith('http://'):
-                return self.url.replace('http://', f'http://{self.username}:{self.password}@', 1)
-            elif self.url.startswith('https://'):
-                return self.url.replace('https://', f'https://{self.username}:{self.password}@', 1)
-        return self.url
+            parts = urlsplit(self.url)
+            if parts.scheme in ('http', 'https'):
+                credentials = f"{quote(self.username, safe='')}:{quote(self.password, safe='')}"
+                auth_url = urlunsplit(parts._replace(netloc=f"{credentials}@{parts.netloc}"))
+        self._auth_url_cache = (key, auth_url)
+        return auth_url
     
     def to_dict(self) -> dict:
         """Convert repository to dictionary for serialization."""
@@ -59,7 +130,7 @@ class PackageRepository:
             name=data['name'],
             url=data['url'],
             username=data.get('username'),
-            password=None,  # Password is not stored in serialized data
+            password=None,  # Password is kept in the keyring, not in serialized data
             is_default=data.get('is_default', False)
         )
 
@@ -78,6 +149,12 @@ class RepositoryManager:
         self.config_dir = config_dir or os.path.join(os.path.expanduser('~'), '.python_package_manager')
         self.config_file = os.path.join(self.config_dir, self.CONFIG_FILE)
         self.repositories: Dict[str, PackageRepository] = {}
+        # Contents of the last successful save, used to skip rewriting an
+        # unchanged file
+        self._last_saved: Optional[bytes] = None
+        # Name of the repository flagged is_default, if any; at most one
+        # repository carries the flag
+        self._default_name: Optional[str] = None
         self._load_repositories()
     
     def _ensure_config_dir(self) -> None:
@@ -86,45 +163,79 @@ class RepositoryManager:
     
     def _load_repositories(self) -> None:
         """Load repositories from the configuration file."""
-        self._ensure_config_dir()
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self.repositories = {
-                        name: PackageRepository.from_dict(repo_data)
-                        for name, repo_data in data.items()
-                    }
-            except Exception as e:
-                logger.error(f"Error loading repositories: {e}")
-                self.repositories = {}
+        try:
+            data = json.loads(Path(self.config_file).read_bytes())
+            self.repositories = {
+                name: PackageRepository.from_dict(repo_data)
+                for name, repo_data in data.items()
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading repositories: {e}")
+            self.repositories = {}
+        
+        # The first repository flagged as default wins
+        for name, repo in self.repositories.items():
+            if repo.is_default:
+                if self._default_name is None:
+                    self._default_name = name
+                else:
+                    repo.is_default = False
         
         # Ensure PyPI is always available
         if 'pypi' not in self.repositories:
+            # Only default to PyPI when no saved repository claims it
             self.add_repository(
-                PackageRepository('pypi', 'https://pypi.org/simple', is_default=True)
+                PackageRepository('pypi', 'https://pypi.org/simple',
+                                  is_default=self._default_name is None)
             )
     
     def save_repositories(self) -> None:
-        """Save repositories to the configuration file."""
-        self._ensure_config_dir()
+        """Save repositories to the configuration file.
+        
+        Nothing is written when the repositories match the last save.
+        """
+        temp_file = self.config_file + '.tmp'
         try:
-            data = {
+            data = json.dumps({
                 name: repo.to_dict()
                 for name, repo in self.repositories.items()
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            }, indent=2).encode('utf-8')
+            if data == self._last_saved:
+                return
+            self._ensure_config_dir()
+            # Write to a temporary file and swap it into place so a failed
+            # write never leaves a truncated repositories.json behind
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, self.config_file)
+            self._last_saved = data
         except Exception as e:
             logger.error(f"Error saving repositories: {e}")
+            if os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
     
     def add_repository(self, repo: PackageRepository) -> None:
         """Add or update a repository.
         
+        A repository added with is_default set replaces the current default.
+        
         Args:
             repo: The repository to add or update
         """
         self.repositories[repo.name] = repo
+        repo.store_password()
+        if repo.is_default:
+            previous = self.repositories.get(self._default_name)
+            if previous is not None and previous is not repo:
+                previous.is_default = False
+            self._default_name = repo.name
+        elif repo.name == self._default_name:
+            self._default_name = None
         self.save_repositories()
     
     def remove_repository(self, name: str) -> bool:
@@ -138,6 +249,8 @@ class RepositoryManager:
         """
         if name in self.repositories and name != 'pypi':  # Prevent removing PyPI
             del self.repositories[name]
+            if name == self._default_name:
+                self._default_name = None
             self.save_repositories()
             return True
         return False
@@ -159,10 +272,7 @@ class RepositoryManager:
         Returns:
             Optional[PackageRepository]: The default repository or None if not set
         """
-        for repo in self.repositories.values():
-            if repo.is_default:
-                return repo
-        return self.get_repository('pypi')  # Fall back to PyPI
+        return self.repositories.get(self._default_name) or self.get_repository('pypi')  # Fall back to PyPI
     
     def list_repositories(self) -> List[PackageRepository]:
         """Get a list of all repositories.
@@ -184,11 +294,13 @@ class RepositoryManager:
         if name not in self.repositories:
             return False
             
-        # Clear default flag from all repositories
-        for repo in self.repositories.values():
-            repo.is_default = False
+        # Only the current default carries the flag
+        previous = self.repositories.get(self._default_name)
+        if previous is not None:
+            previous.is_default = False
             
         # Set the new default
         self.repositories[name].is_default = True
+        self._default_name = name
         self.save_repositories()
         return True
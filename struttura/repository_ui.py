@@ -8,7 +8,11 @@ from .repository import RepositoryManager, PackageRepository
 from .lang import tr
 
 class RepositoryDialog(tk.Toplevel):
-    """Dialog for adding/editing a repository."""
+    """Dialog for adding/editing a repository.
+    
+    Closing the dialog only hides it, so one instance can be shown again
+    with open().
+    """
     
     def __init__(self, parent, repository: PackageRepository = None, on_save: Callable = None):
         """Initialize the dialog.
@@ -19,24 +23,50 @@ class RepositoryDialog(tk.Toplevel):
             on_save: Callback when repository is saved
         """
         super().__init__(parent)
-        self.title(tr('edit_repository') if repository else tr('add_repository'))
         self.parent = parent
-        self.on_save = on_save
-        self.repository = repository or PackageRepository('', '')
+        self._closed = tk.BooleanVar(self, value=True)
         
         self._create_widgets()
+        self.transient(parent)
+        self.protocol('WM_DELETE_WINDOW', self.close)
+        # Release anyone in wait_closed() if the parent takes us down
+        self.bind('<Destroy>', lambda e: e.widget is self and self._closed.set(True))
+        self.open(repository, on_save)
+    
+    def open(self, repository: PackageRepository = None, on_save: Callable = None):
+        """Show the dialog for a repository, or for a new one if none is given.
+        
+        Args:
+            repository: Optional repository to edit
+            on_save: Callback when repository is saved
+        """
+        self.title(tr('edit_repository') if repository else tr('add_repository'))
+        self.on_save = on_save
+        self.repository = repository or PackageRepository('', '')
         self._populate_fields()
         
         # Center the dialog
-        self.transient(parent)
+        self._closed.set(False)
+        self.deiconify()
         self.grab_set()
         self.update_idletasks()
         width = 400
         height = 250
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (width // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (height // 2)
+        x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (width // 2)
+        y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
     
+    def close(self):
+        """Hide the dialog so it can be opened again."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+    
+    def wait_closed(self):
+        """Wait until the dialog is closed or hidden."""
+        if not self._closed.get():
+            self.wait_variable(self._closed)
+    
     def _create_widgets(self):
         """Create the dialog widgets."""
         main_frame = ttk.Frame(self, padding=10)
@@ -44,38 +74,30 @@ class RepositoryDialog(tk.Toplevel):
         
         # Name
         ttk.Label(main_frame, text=f"{tr('name')}:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.name_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.name_var).grid(
-            row=0, column=1, sticky=tk.EW, padx=5, pady=2
-        )
+        self.name_entry = ttk.Entry(main_frame)
+        self.name_entry.grid(row=0, column=1, sticky=tk.EW, padx=5, pady=2)
         
         # URL
         ttk.Label(main_frame, text="URL:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.url_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.url_var).grid(
-            row=1, column=1, sticky=tk.EW, padx=5, pady=2
-        )
+        self.url_entry = ttk.Entry(main_frame)
+        self.url_entry.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=2)
         
         # Username
         ttk.Label(main_frame, text=f"{tr('username')} (optional):").grid(
             row=2, column=0, sticky=tk.W, pady=2
         )
-        self.username_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.username_var).grid(
-            row=2, column=1, sticky=tk.EW, padx=5, pady=2
-        )
+        self.username_entry = ttk.Entry(main_frame)
+        self.username_entry.grid(row=2, column=1, sticky=tk.EW, padx=5, pady=2)
         
         # Password
         ttk.Label(main_frame, text=f"{tr('password')} (optional):").grid(
             row=3, column=0, sticky=tk.W, pady=2
         )
-        self.password_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.password_var, show="*").grid(
-            row=3, column=1, sticky=tk.EW, padx=5, pady=2
-        )
+        self.password_entry = ttk.Entry(main_frame, show="*")
+        self.password_entry.grid(row=3, column=1, sticky=tk.EW, padx=5, pady=2)
         
         # Default checkbox
-        self.default_var = tk.BooleanVar(value=self.repository.is_default)
+        self.default_var = tk.BooleanVar(self)
         ttk.Checkbutton(
             main_frame, 
             text=tr('set_as_default'),
@@ -89,7 +111,7 @@ class RepositoryDialog(tk.Toplevel):
         ttk.Button(
             button_frame, 
             text=tr('cancel'), 
-            command=self.destroy
+            command=self.close
         ).pack(side=tk.RIGHT, padx=5)
         
         ttk.Button(
@@ -107,18 +129,23 @@ class RepositoryDialog(tk.Toplevel):
     
     def _populate_fields(self):
         """Populate the form fields with repository data."""
-        if self.repository:
-            self.name_var.set(self.repository.name)
-            self.url_var.set(self.repository.url)
-            self.username_var.set(self.repository.username or '')
+        for entry, value in (
+            (self.name_entry, self.repository.name),
+            (self.url_entry, self.repository.url),
+            (self.username_entry, self.repository.username or ''),
             # Don't pre-fill password for security
+            (self.password_entry, ''),
+        ):
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+        self.default_var.set(self.repository.is_default)
     
     def _on_save(self):
         """Handle save button click."""
-        name = self.name_var.get().strip()
-        url = self.url_var.get().strip()
-        username = self.username_var.get().strip() or None
-        password = self.password_var.get() or None
+        name = self.name_entry.get().strip()
+        url = self.url_entry.get().strip()
+        username = self.username_entry.get().strip() or None
+        password = self.password_entry.get() or None
         is_default = self.default_var.get()
         
         if not name:
@@ -141,7 +168,7 @@ class RepositoryDialog(tk.Toplevel):
         if self.on_save:
             self.on_save(self.repository)
         
-        self.destroy()
+        self.close()
 
 
 class RepositoryManagerFrame(ttk.Frame):
@@ -156,6 +183,11 @@ class RepositoryManagerFrame(ttk.Frame):
         """
         super().__init__(parent, **kwargs)
         self.repository_manager = repository_manager
+        # Add/edit dialog, created on first use and reused afterwards
+        self._dialog: Optional[RepositoryDialog] = None
+        # Row values currently shown in the treeview, keyed by repository
+        # name (which is also the row's iid)
+        self._row_values: Dict[str, tuple] = {}
         self._create_widgets()
         self._load_repositories()
     
@@ -228,19 +260,31 @@ class RepositoryManagerFrame(ttk.Frame):
         self.tree.bind('<<TreeviewSelect>>', self._on_selection_changed)
     
     def _load_repositories(self):
-        """Load repositories into the treeview."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add repositories
-        for repo in self.repository_manager.list_repositories():
-            self.tree.insert('', tk.END, values=(
+        """Sync the treeview with the repositories, touching only changed rows."""
+        repos = {repo.name: repo for repo in self.repository_manager.list_repositories()}
+        
+        # Drop rows for removed repositories
+        for name in self._row_values.keys() - repos.keys():
+            self.tree.delete(name)
+            del self._row_values[name]
+        
+        # Add new repositories and update the ones that changed
+        for name, repo in repos.items():
+            values = (
                 repo.name,
                 repo.url,
                 '✓' if repo.username else '',
                 '✓' if repo.is_default else ''
-            ), tags=('default' if repo.is_default else '',))
+            )
+            old_values = self._row_values.get(name)
+            if old_values == values:
+                continue
+            tags = ('default' if repo.is_default else '',)
+            if old_values is None:
+                self.tree.insert('', tk.END, iid=name, values=values, tags=tags)
+            else:
+                self.tree.item(name, values=values, tags=tags)
+            self._row_values[name] = values
         
         # Update button states
         self._update_button_states()
@@ -256,14 +300,21 @@ class RepositoryManagerFrame(ttk.Frame):
         self.remove_btn.config(state=tk.NORMAL if selected else tk.DISABLED)
         self.set_default_btn.config(state=tk.NORMAL if selected else tk.DISABLED)
     
+    def _show_dialog(self, repository: Optional[PackageRepository], on_save: Callable):
+        """Open the shared add/edit dialog and wait until it is closed."""
+        if self._dialog is None or not self._dialog.winfo_exists():
+            self._dialog = RepositoryDialog(self, repository, on_save=on_save)
+        else:
+            self._dialog.open(repository, on_save)
+        self._dialog.wait_closed()
+    
     def _on_add_repository(self):
         """Handle add repository button click."""
         def on_save(repo):
             self.repository_manager.add_repository(repo)
             self._load_repositories()
         
-        dialog = RepositoryDialog(self, on_save=on_save)
-        dialog.wait_window()
+        self._show_dialog(None, on_save)
     
     def _on_edit_repository(self):
         """Handle edit repository button click."""
@@ -271,8 +322,8 @@ class RepositoryManagerFrame(ttk.Frame):
         if not selected:
             return
             
-        item = selected[0]
-        repo_name = self.tree.item(item, 'values')[0]
+        # Rows use the repository name as their iid
+        repo_name = selected[0]
         repo = self.repository_manager.get_repository(repo_name)
         
         if not repo:
@@ -283,8 +334,7 @@ class RepositoryManagerFrame(ttk.Frame):
             self.repository_manager.add_repository(updated_repo)
             self._load_repositories()
         
-        dialog = RepositoryDialog(self, repo, on_save=on_save)
-        dialog.wait_window()
+        self._show_dialog(repo, on_save)
     
     def _on_remove_repository(self):
         """Handle remove repository button click."""
@@ -292,8 +342,8 @@ class RepositoryManagerFrame(ttk.Frame):
         if not selected:
             return
             
-        item = selected[0]
-        repo_name = self.tree.item(item, 'values')[0]
+        # Rows use the repository name as their iid
+        repo_name = selected[0]
         
         if messagebox.askyesno(
             tr('confirm_removal'),
@@ -308,8 +358,8 @@ class RepositoryManagerFrame(ttk.Frame):
         if not selected:
             return
             
-        item = selected[0]
-        repo_name = self.tree.item(item, 'values')[0]
+        # Rows use the repository name as their iid
+        repo_name = selected[0]
         
         if self.repository_manager.set_default_repository(repo_name):
             self._load_repositories()
@@ -1,33 +1,46 @@
 import tkinter as tk
 import webbrowser
+from functools import partial
 from .lang import tr
 
+# (translation key, URL) of each sponsor button
+SPONSOR_LINKS = (
+    ('sponsor_on_github', "https://github.com/sponsors/Nsfr750"),
+    ('join_discord', "https://discord.gg/BvvkUEP9"),
+    ('buy_me_a_coffee', "https://paypal.me/3dmega"),
+    ('join_the_patreon', "https://www.patreon.com/Nsfr750"),
+)
+
 # Sponsor Class
 
 class Sponsor:
+    # The dialog is built once and hidden on close, so later opens only show it again
+    _dialog = None
+
     def __init__(self, root):
         self.root = root
 
     def show_sponsor(self):
+        dialog = Sponsor._dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.lift()
+            return
+
         dialog = tk.Toplevel(self.root)
         dialog.title(tr('sponsor'))
         dialog.geometry('500x150')
+        dialog.protocol('WM_DELETE_WINDOW', dialog.withdraw)
         
         # Sponsor buttons
         btn_frame = tk.Frame(dialog)
         btn_frame.pack(pady=20)
         
-        buttons = [
-            (tr('sponsor_on_github'), "https://github.com/sponsors/Nsfr750"),
-            (tr('join_discord'), "https://discord.gg/BvvkUEP9"),
-            (tr('buy_me_a_coffee'), "https://paypal.me/3dmega"),
-            (tr('join_the_patreon'), "https://www.patreon.com/Nsfr750")
-        ]
-        
-        for text, url in buttons:
-            btn = tk.Button(btn_frame, text=text, pady=5,
-                          command=lambda u=url: webbrowser.open(u))
+        for key, url in SPONSOR_LINKS:
+            btn = tk.Button(btn_frame, text=tr(key), pady=5,
+                          command=partial(webbrowser.open, url))
             btn.pack(side=tk.LEFT, padx=5)
         
         # Close button
-        tk.Button(dialog, text=tr('close'), command=dialog.destroy).pack(pady=10)
+        tk.Button(dialog, text=tr('close'), command=dialog.withdraw).pack(pady=10)
+        Sponsor._dialog = dialog
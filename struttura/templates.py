@@ -3,56 +3,30 @@ Package templates for different types of Python projects.
 """
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import shutil
-import json
+from typing import Dict, List, Optional
 
-class PackageTemplate:
-    """Base class for package templates."""
-    
-    def __init__(self, name: str, description: str):
-        self.name = name
-        self.description = description
-    
-    def create(self, path: str, package_name: str, **kwargs) -> bool:
-        """Create the template in the specified path."""
-        raise NotImplementedError("Subclasses must implement create()")
+# File contents written by the templates, built once at import. The *_TEMPLATE
+# strings are filled in with str.format(package_name=...); the rest are used
+# as they are.
 
+_INIT_TEMPLATE = (
+    '"""{package_name} package."""\n'
+    '__version__ = "0.1.0"\n'
+)
 
-class BasicPackageTemplate(PackageTemplate):
-    """Basic Python package template."""
-    
-    def __init__(self):
-        super().__init__(
-            name="basic",
-            description="A basic Python package with minimal structure"
-        )
-    
-    def create(self, path: str, package_name: str, **kwargs) -> bool:
-        """Create a basic Python package."""
-        try:
-            # Create package directory
-            package_dir = Path(path) / package_name
-            package_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create __init__.py
-            (package_dir / "__init__.py").write_text(
-                f'"""{package_name} package."""\n'
-                f'__version__ = "0.1.0"\n'
-            )
-            
-            # Create setup.py
-            setup_content = f"""from setuptools import setup, find_packages
+_SETUP_PY_TEMPLATE = """from pathlib import Path
+
+from setuptools import setup, find_packages
 
 setup(
     name="{package_name}",
     version="0.1.0",
-    packages=find_packages(),
-    install_requires=[],
+    packages={packages},
+    install_requires=[{install_requires}],{setup_extra}
     author="Your Name",
     author_email="your.email@example.com",
     description="A short description of your package",
-    long_description=open("README.md").read(),
+    long_description=Path("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/{package_name}",
     classifiers=[
@@ -63,10 +37,8 @@ setup(
     python_requires=">=3.6",
 )
 """
-            (Path(path) / "setup.py").write_text(setup_content)
-            
-            # Create README.md
-            readme_content = f"""# {package_name}
+
+_README_TEMPLATE = """# {package_name}
 
 A Python package.
 
@@ -82,51 +54,16 @@ pip install -e .
 import {package_name}
 ```
 """
-            (Path(path) / "README.md").write_text(readme_content)
-            
-            # Create requirements.txt
-            (Path(path) / "requirements.txt").write_text("")
-            
-            # Create tests directory
-            tests_dir = Path(path) / "tests"
-            tests_dir.mkdir()
-            (tests_dir / "__init__.py").write_text("")
-            (tests_dir / "test_basic.py").write_text(
-                f'"""Tests for {package_name}."""\n'
-                'def test_import():\n'
-                '    """Test that the package can be imported."""\n'
-                f'    import {package_name}\n'
-                f'    assert {package_name}.__version__ == "0.1.0"\n'
-            )
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating basic package: {e}")
-            return False
 
+_TEST_BASIC_TEMPLATE = (
+    '"""Tests for {package_name}."""\n'
+    'def test_import():\n'
+    '    """Test that the package can be imported."""\n'
+    '    import {package_name}\n'
+    '    assert {package_name}.__version__ == "0.1.0"\n'
+)
 
-class CliPackageTemplate(PackageTemplate):
-    """Command-line application package template."""
-    
-    def __init__(self):
-        super().__init__(
-            name="cli",
-            description="A command-line application package with Click"
-        )
-    
-    def create(self, path: str, package_name: str, **kwargs) -> bool:
-        """Create a CLI application package."""
-        try:
-            # Create basic package structure
-            basic = BasicPackageTemplate()
-            if not basic.create(path, package_name, **kwargs):
-                return False
-                
-            package_dir = Path(path) / package_name
-            
-            # Create main CLI module
-            cli_content = '''import click
+_CLI_MODULE_TEMPLATE = '''import click
 
 @click.group()
 def cli():
@@ -142,25 +79,15 @@ def hello(name):
 if __name__ == '__main__':
     cli()
 '''
-            (package_dir / "cli.py").write_text(cli_content.format(package_name=package_name))
-            
-            # Update __init__.py to expose the CLI
-            with open(package_dir / "__init__.py", 'a') as f:
-                f.write(f'\nfrom .cli import cli\n')
-            
-            # Update setup.py to include console_scripts
-            setup_path = Path(path) / "setup.py"
-            setup_content = setup_path.read_text()
-            setup_content = setup_content.replace(
-                'install_requires=[],',
-                'install_requires=["click>=7.0"],\n    entry_points={\n        "console_scripts": [\n            f"{package_name}={package_name}.cli:cli",\n        ],\n    },'
-            )
-            setup_path.write_text(setup_content)
-            
-            # Update README.md with CLI instructions
-            readme_path = Path(path) / "README.md"
-            readme_content = readme_path.read_text()
-            readme_content += """
+
+_CLI_ENTRY_POINTS_TEMPLATE = """
+    entry_points={{
+        "console_scripts": [
+            "{package_name}={package_name}.cli:cli",
+        ],
+    }},"""
+
+_CLI_README_TEMPLATE = """
 
 ## Command-line Usage
 
@@ -173,36 +100,8 @@ pip install -e ".[dev]"
 {package_name} hello --name YourName
 ```
 """
-            readme_path.write_text(readme_content)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating CLI package: {e}")
-            return False
 
-
-class WebAppPackageTemplate(PackageTemplate):
-    """Web application package template using Flask."""
-    
-    def __init__(self):
-        super().__init__(
-            name="web",
-            description="A web application package with Flask"
-        )
-    
-    def create(self, path: str, package_name: str, **kwargs) -> bool:
-        """Create a web application package."""
-        try:
-            # Create basic package structure
-            basic = BasicPackageTemplate()
-            if not basic.create(path, package_name, **kwargs):
-                return False
-                
-            package_dir = Path(path) / package_name
-            
-            # Create web application files
-            (package_dir / "app.py").write_text("""from flask import Flask
+_WEB_APP_MODULE = """from flask import Flask
 
 def create_app():
     \"\"\"Create and configure the Flask application.\"\"\"
@@ -217,12 +116,9 @@ def create_app():
 if __name__ == '__main__':
     app = create_app()
     app.run(debug=True)
-""")
-            
-            # Create templates directory
-            templates_dir = package_dir / "templates"
-            templates_dir.mkdir()
-            (templates_dir / "base.html").write_text("""<!DOCTYPE html>
+"""
+
+_BASE_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>{% block title %}{% endblock %}</title>
@@ -233,30 +129,18 @@ if __name__ == '__main__':
     </div>
 </body>
 </html>
-""")
-            
-            (templates_dir / "index.html").write_text("""{% extends "base.html" %}
+"""
+
+_INDEX_HTML = """{% extends "base.html" %}
 
 {% block title %}Home{% endblock %}
 
 {% block content %}
 <h1>Welcome to {{ app_name }}!</h1>
 {% endblock %}
-""")
-            
-            # Update setup.py
-            setup_path = Path(path) / "setup.py"
-            setup_content = setup_path.read_text()
-            setup_content = setup_content.replace(
-                'install_requires=[],',
-                'install_requires=["flask>=2.0.0"],'
-            )
-            setup_path.write_text(setup_content)
-            
-            # Update README.md
-            readme_path = Path(path) / "README.md"
-            readme_content = readme_path.read_text()
-            readme_content += """
+"""
+
+_WEB_README_TEMPLATE = """
 ## Web Application
 
 ### Development
@@ -273,47 +157,8 @@ flask run
 
 Visit http://localhost:5000 in your browser.
 """
-            readme_path.write_text(readme_content)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating web app package: {e}")
-            return False
 
-
-class DataSciencePackageTemplate(PackageTemplate):
-    """Data science project package template."""
-    
-    def __init__(self):
-        super().__init__(
-            name="data-science",
-            description="A data science project with Jupyter, pandas, and scikit-learn"
-        )
-    
-    def create(self, path: str, package_name: str, **kwargs) -> bool:
-        """Create a data science project package."""
-        try:
-            # Create basic package structure
-            basic = BasicPackageTemplate()
-            if not basic.create(path, package_name, **kwargs):
-                return False
-                
-            package_dir = Path(path) / package_name
-            
-            # Create data directory
-            data_dir = Path(path) / "data"
-            data_dir.mkdir()
-            (data_dir / "raw").mkdir()
-            (data_dir / "processed").mkdir()
-            (data_dir / "external").mkdir()
-            
-            # Create notebooks directory
-            notebooks_dir = Path(path) / "notebooks"
-            notebooks_dir.mkdir()
-            
-            # Create example notebook
-            (notebooks_dir / "01_exploratory.ipynb").write_text("""{
+_NOTEBOOK_JSON = """{
  "cells": [
   {
    "cell_type": "markdown",
@@ -361,19 +206,9 @@ class DataSciencePackageTemplate(PackageTemplate):
  },
  "nbformat": 4,
  "nbformat_minor": 4
-}""")
-            
-            # Create src directory for modules
-            src_dir = Path(path) / "src"
-            src_dir.mkdir()
-            (src_dir / "__init__.py").write_text("")
-            (src_dir / "data").mkdir()
-            (src_dir / "features").mkdir()
-            (src_dir / "models").mkdir()
-            (src_dir / "visualization").mkdir()
-            
-            # Create requirements file
-            (Path(path) / "requirements.txt").write_text("""# Core
+}"""
+
+_DATA_SCIENCE_REQUIREMENTS = """# Core
 numpy>=1.19.0
 pandas>=1.0.0
 matplotlib>=3.0.0
@@ -386,21 +221,12 @@ ipykernel
 pytest>=6.0.0
 black>=21.0
 flake8>=3.8.0
-""")
-            
-            # Update setup.py
-            setup_path = Path(path) / "setup.py"
-            setup_content = setup_path.read_text()
-            setup_content = setup_content.replace(
-                'packages=find_packages(),',
-                'packages=find_packages() + ["src"],\n    package_dir={"": "."},'
-            )
-            setup_path.write_text(setup_content)
-            
-            # Update README.md
-            readme_path = Path(path) / "README.md"
-            readme_content = readme_path.read_text()
-            readme_content += """
+"""
+
+_DATA_SCIENCE_SETUP_EXTRA = """
+    package_dir={{"": "."}},"""
+
+_DATA_SCIENCE_README_TEMPLATE = """
 ## Data Science Project
 
 ### Project Structure
@@ -438,10 +264,20 @@ pip install -r requirements.txt
 pip install -e .
 ```
 """
-            readme_path.write_text(readme_content)
-            
-            # Create .gitignore
-            (Path(path) / ".gitignore").write_text("""# Byte-compiled / optimized / DLL files
+
+# Leaf directories of the data science layout, created with their parents
+_DATA_SCIENCE_DIRS = (
+    "data/raw",
+    "data/processed",
+    "data/external",
+    "notebooks",
+    "src/data",
+    "src/features",
+    "src/models",
+    "src/visualization",
+)
+
+_GITIGNORE = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -523,7 +359,204 @@ env/
 # Logs
 logs/
 *.log
-""")
+"""
+
+# Static files are encoded once here and written with write_bytes
+_WEB_APP_MODULE_BYTES = _WEB_APP_MODULE.encode("utf-8")
+_BASE_HTML_BYTES = _BASE_HTML.encode("utf-8")
+_INDEX_HTML_BYTES = _INDEX_HTML.encode("utf-8")
+_NOTEBOOK_JSON_BYTES = _NOTEBOOK_JSON.encode("utf-8")
+_GITIGNORE_BYTES = _GITIGNORE.encode("utf-8")
+
+
+class PackageTemplate:
+    """Base class for package templates."""
+    
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+    
+    def create(self, path: str, package_name: str, **kwargs) -> bool:
+        """Create the template in the specified path."""
+        raise NotImplementedError("Subclasses must implement create()")
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write content as UTF-8 with '\\n' line endings on every platform."""
+    path.write_bytes(content.encode("utf-8"))
+
+
+def _scaffold(path: str, package_name: str, *, packages: str = "find_packages()",
+              install_requires=(), setup_extra: str = "", readme_extra: str = "",
+              init_extra: str = "", requirements: str = "") -> Path:
+    """Write the files shared by all templates, each in a single write.
+    
+    Args:
+        path: Project directory
+        package_name: Name of the package
+        packages: Expression passed as setup(packages=...)
+        install_requires: Requirements listed in setup.py
+        setup_extra: Template for extra setup() arguments
+        readme_extra: Template appended to README.md
+        init_extra: Text appended to the package's __init__.py
+        requirements: Contents of requirements.txt
+    
+    Returns:
+        Path: The package directory, inside the project directory
+    """
+    base = Path(path)
+    package_dir = base / package_name
+    package_dir.mkdir(parents=True, exist_ok=True)
+    
+    _write_text(
+        package_dir / "__init__.py",
+        _INIT_TEMPLATE.format(package_name=package_name) + init_extra,
+    )
+    _write_text(base / "setup.py", _SETUP_PY_TEMPLATE.format(
+        package_name=package_name,
+        packages=packages,
+        install_requires=", ".join(f'"{req}"' for req in install_requires),
+        setup_extra=setup_extra.format(package_name=package_name),
+    ))
+    _write_text(
+        base / "README.md",
+        _README_TEMPLATE.format(package_name=package_name)
+        + readme_extra.format(package_name=package_name),
+    )
+    _write_text(base / "requirements.txt", requirements)
+    
+    tests_dir = base / "tests"
+    tests_dir.mkdir(parents=True, exist_ok=True)
+    _write_text(tests_dir / "__init__.py", "")
+    _write_text(
+        tests_dir / "test_basic.py",
+        _TEST_BASIC_TEMPLATE.format(package_name=package_name),
+    )
+    return package_dir
+
+
+class BasicPackageTemplate(PackageTemplate):
+    """Basic Python package template."""
+    
+    def __init__(self):
+        super().__init__(
+            name="basic",
+            description="A basic Python package with minimal structure"
+        )
+    
+    def create(self, path: str, package_name: str, **kwargs) -> bool:
+        """Create a basic Python package."""
+        try:
+            _scaffold(path, package_name)
+            return True
+            
+        except Exception as e:
+            print(f"Error creating basic package: {e}")
+            return False
+
+
+class CliPackageTemplate(PackageTemplate):
+    """Command-line application package template."""
+    
+    def __init__(self):
+        super().__init__(
+            name="cli",
+            description="A command-line application package with Click"
+        )
+    
+    def create(self, path: str, package_name: str, **kwargs) -> bool:
+        """Create a CLI application package."""
+        try:
+            # Create basic package structure with the CLI wired in
+            package_dir = _scaffold(
+                path, package_name,
+                install_requires=("click>=7.0",),
+                setup_extra=_CLI_ENTRY_POINTS_TEMPLATE,
+                readme_extra=_CLI_README_TEMPLATE,
+                init_extra="\nfrom .cli import cli\n",
+            )
+            
+            # Create main CLI module
+            _write_text(package_dir / "cli.py", _CLI_MODULE_TEMPLATE.format(package_name=package_name))
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error creating CLI package: {e}")
+            return False
+
+
+class WebAppPackageTemplate(PackageTemplate):
+    """Web application package template using Flask."""
+    
+    def __init__(self):
+        super().__init__(
+            name="web",
+            description="A web application package with Flask"
+        )
+    
+    def create(self, path: str, package_name: str, **kwargs) -> bool:
+        """Create a web application package."""
+        try:
+            # Create basic package structure
+            package_dir = _scaffold(
+                path, package_name,
+                install_requires=("flask>=2.0.0",),
+                readme_extra=_WEB_README_TEMPLATE,
+            )
+            
+            # Create web application files
+            (package_dir / "app.py").write_bytes(_WEB_APP_MODULE_BYTES)
+            
+            # Create templates directory
+            templates_dir = package_dir / "templates"
+            templates_dir.mkdir(exist_ok=True)
+            (templates_dir / "base.html").write_bytes(_BASE_HTML_BYTES)
+            
+            (templates_dir / "index.html").write_bytes(_INDEX_HTML_BYTES)
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error creating web app package: {e}")
+            return False
+
+
+class DataSciencePackageTemplate(PackageTemplate):
+    """Data science project package template."""
+    
+    def __init__(self):
+        super().__init__(
+            name="data-science",
+            description="A data science project with Jupyter, pandas, and scikit-learn"
+        )
+    
+    def create(self, path: str, package_name: str, **kwargs) -> bool:
+        """Create a data science project package."""
+        try:
+            # Create basic package structure with src/ packaged alongside
+            package_dir = _scaffold(
+                path, package_name,
+                packages='find_packages() + ["src"]',
+                setup_extra=_DATA_SCIENCE_SETUP_EXTRA,
+                readme_extra=_DATA_SCIENCE_README_TEMPLATE,
+                requirements=_DATA_SCIENCE_REQUIREMENTS,
+            )
+            base = package_dir.parent
+            
+            # Create the data, notebooks and src directories; creating the
+            # leaves also creates data/ and src/
+            for leaf in _DATA_SCIENCE_DIRS:
+                (base / leaf).mkdir(parents=True, exist_ok=True)
+            
+            # Create example notebook
+            (base / "notebooks" / "01_exploratory.ipynb").write_bytes(_NOTEBOOK_JSON_BYTES)
+            
+            # Make src a package for the project's modules
+            _write_text(base / "src" / "__init__.py", "")
+            
+            # Create .gitignore
+            (base / ".gitignore").write_bytes(_GITIGNORE_BYTES)
             
             return True
             
@@ -574,12 +607,9 @@ class PackageTemplateManager:
             raise ValueError(f"Unknown template: {template_name}")
             
         path = os.path.abspath(path)
-        package_dir = os.path.join(path, package_name)
-        
-        # Create the directory if it doesn't exist
-        os.makedirs(package_dir, exist_ok=True)
         
-        # Create the package using the template
+        # Create the package using the template; it creates the package
+        # directory itself
         return template.create(path, package_name, **kwargs)
 
 
@@ -4,17 +4,17 @@ Traceback Logger
 
 import sys
 import traceback as _std_traceback
-import datetime
 
-LOG_FILE = 'traceback.log'
+from . import logger as _logger
 
 def log_exception(exc_type, exc_value, exc_tb):
     """
     Logs uncaught exceptions and their tracebacks to Traceback.log.
+
+    The entry goes through struttura.logger, so the one rotating handler
+    that owns the file writes it, header and traceback, in a single write.
     """
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(f"\n[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Uncaught exception:\n")
-        _std_traceback.print_exception(exc_type, exc_value, exc_tb, file=f)
+    _logger.log_exception(exc_type, exc_value, exc_tb)
 
 def get_traceback_module():
     """
@@ -4,38 +4,44 @@ Script to fix imports in all Python files after moving from app/ to root.
 """
 import os
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# One pass over the file handles all three import forms:
+#   'from app.module import' -> 'from module import'
+#   'import app.module'      -> 'import module'
+#   'from .module import'    -> 'from module import'
+IMPORT_RE = re.compile(
+    r'from\s+app\.(\w+)\s+import'
+    r'|import\s+app\.(\w+)'
+    r'|from\s+\.(\w+)\s+import'
+)
+
+def _replace_import(match):
+    app_from, app_import, relative_from = match.groups()
+    if app_from:
+        return f'from {app_from} import'
+    if app_import:
+        return f'import {app_import}'
+    return f'from {relative_from} import'
+
+# Matches wherever IMPORT_RE could match; used on the raw bytes to skip
+# files without any of the imports before decoding them
+CANDIDATE_RE = re.compile(rb'app\.|from\s+\.')
 
 def update_imports_in_file(file_path):
     """Update import statements in a Python file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Update imports like 'from app.module' to 'from module'
-        updated_content = re.sub(
-            r'from\s+app\.(\w+)\s+import',
-            r'from \1 import',
-            content
-        )
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if not CANDIDATE_RE.search(data):
+            return False
+        content = data.decode('utf-8')
         
-        # Update imports like 'import module' to 'import module'
-        updated_content = re.sub(
-            r'import\s+app\.(\w+)',
-            r'import \1',
-            updated_content
-        )
-        
-        # Update relative imports if needed
-        updated_content = re.sub(
-            r'from\s+\.(\w+)\s+import',
-            r'from \1 import',
-            updated_content
-        )
+        updated_content = IMPORT_RE.sub(_replace_import, content)
         
         if updated_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            with open(file_path, 'wb') as f:
+                f.write(updated_content.encode('utf-8'))
             print(f"Updated imports in {file_path}")
             return True
         return False
@@ -43,13 +49,25 @@ def update_imports_in_file(file_path):
         print(f"Error processing {file_path}: {e}")
         return False
 
+# Directories that never hold project sources
+SKIP_DIRS = {'__pycache__', '.git', 'venv', '.venv', '.tox'}
+
+def iter_python_files(root):
+    """Yield the paths of all .py files under root, skipping SKIP_DIRS."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
 def main():
-    updated_count = 0
-    
-    # Process all Python files in the project
-    for py_file in Path('.').rglob('*.py'):
-        if update_imports_in_file(str(py_file)):
-            updated_count += 1
+    # Process all Python files in the project. Each file is independent and
+    # the work is mostly I/O, so files are handled by a thread pool.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        updated_count = sum(executor.map(update_imports_in_file, iter_python_files('.')))
     
     print(f"\nUpdated imports in {updated_count} files.")
 
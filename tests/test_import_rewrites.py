@@ -0,0 +1,55 @@
+import re
+import pytest
+import test_fix_imports as fix_imports
+import test_move_and_update as move_and_update
+
+def _sequential_sub(content, relative=True):
+    # The per-form re.sub chain the combined IMPORT_RE replaced
+    content = re.sub(r'from\s+app\.(\w+)\s+import', r'from \1 import', content)
+    content = re.sub(r'import\s+app\.(\w+)', r'import \1', content)
+    if relative:
+        content = re.sub(r'from\s+\.(\w+)\s+import', r'from \1 import', content)
+    return content
+
+SAMPLES = [
+    'from app.main import run\n',
+    'import app.utils\n',
+    'from .helpers import helper\n',
+    'from  app.main  import run\nimport\tapp.utils as u\n',
+    'import os\nfrom app.a import b\n\ndef f():\n    import app.c\n    from .d import e\n',
+    'from app.pkg.sub import thing\nfrom ..parent import x\n',
+    'import os\nimport sys\n',
+    '# mentions app.main but imports nothing from it\n',
+]
+
+@pytest.mark.parametrize('source', SAMPLES)
+def test_fix_imports_single_pass_matches_sequential(source):
+    assert fix_imports.IMPORT_RE.sub(fix_imports._replace_import, source) == _sequential_sub(source)
+
+@pytest.mark.parametrize('source', SAMPLES)
+def test_move_and_update_single_pass_matches_sequential(source):
+    assert move_and_update.IMPORT_RE.sub(move_and_update._replace_import, source) == _sequential_sub(source, relative=False)
+
+@pytest.mark.parametrize('source', SAMPLES)
+def test_prefilter_keeps_every_file_that_would_change(source):
+    data = source.encode('utf-8')
+    if fix_imports.IMPORT_RE.sub(fix_imports._replace_import, source) != source:
+        assert fix_imports.CANDIDATE_RE.search(data)
+    if move_and_update.IMPORT_RE.sub(move_and_update._replace_import, source) != source:
+        assert b'app.' in data
+
+@pytest.mark.parametrize('module', [fix_imports, move_and_update])
+def test_crlf_line_endings_survive_rewrite(tmp_path, module):
+    path = tmp_path / 'sample.py'
+    path.write_bytes(b'import os\r\nfrom app.foo import bar\r\nimport app.baz\r\n')
+    module.update_imports_in_file(path)
+    assert path.read_bytes() == b'import os\r\nfrom foo import bar\r\nimport baz\r\n'
+
+@pytest.mark.parametrize('module', [fix_imports, move_and_update])
+def test_file_without_app_imports_is_left_untouched(tmp_path, module):
+    path = tmp_path / 'sample.py'
+    path.write_bytes(b'import os\r\n')
+    mtime = path.stat().st_mtime_ns
+    module.update_imports_in_file(path)
+    assert path.read_bytes() == b'import os\r\n'
+    assert path.stat().st_mtime_ns == mtime
@@ -0,0 +1,133 @@
+import json
+import string
+import pytest
+from struttura import lang
+
+@pytest.fixture
+def translator(monkeypatch):
+    monkeypatch.setattr(lang, '_save_config', lambda config: None)
+    monkeypatch.setattr(lang, '_config_cache', {})
+    return lang.Translator()
+
+def test_translate_plain_key(translator):
+    assert translator.translate('btn_ok') == 'OK'
+
+def test_translate_unknown_key_returns_key(translator):
+    assert translator.translate('no_such_key') == 'no_such_key'
+
+def test_translate_formats_kwargs(translator):
+    assert translator.translate('project_not_found', path='/tmp/x') == 'Project not found at /tmp/x'
+    assert translator.translate('project_not_found', path='/tmp/y') == 'Project not found at /tmp/y'
+
+def test_translate_unhashable_kwargs(translator):
+    assert translator.translate('project_not_found', path=['a']) == "Project not found at ['a']"
+
+def test_translate_does_not_reuse_text_for_equal_kwargs(translator):
+    assert translator.translate('project_not_found', path=1) == 'Project not found at 1'
+    assert translator.translate('project_not_found', path=True) == 'Project not found at True'
+    assert translator.translate('project_not_found', path=1.0) == 'Project not found at 1.0'
+
+def test_set_language_switches_translations(translator):
+    assert translator.translate('menu_edit') == 'Edit'
+    assert translator.set_language('it')
+    assert translator.translate('menu_edit') == 'Modifica'
+
+def test_lang_files_loaded_once(monkeypatch):
+    monkeypatch.setattr(lang, '_LOADED', {})
+    table = lang._load_lang_file('de')
+    assert list(lang._LOADED) == ['de']
+    assert lang._load_lang_file('de') is table
+
+def test_every_supported_language_has_a_file():
+    for code in lang.SUPPORTED_LANGUAGES:
+        assert (lang.LOCALES_DIR / f'{code}.json').is_file()
+
+def test_missing_key_falls_back_to_default_language():
+    table = lang._get_translations('it')
+    assert 'check_for_update' not in lang._load_lang_file('it')
+    assert table['check_for_update'] == lang._load_lang_file('en')['check_for_update']
+    assert table['menu_edit'] == 'Modifica'
+
+def test_lang_files_have_no_duplicate_keys():
+    def check_pairs(pairs):
+        keys = [key for key, _ in pairs]
+        assert len(keys) == len(set(keys)), sorted(k for k in keys if keys.count(k) > 1)
+        return dict(pairs)
+
+    for path in lang.LOCALES_DIR.glob('*.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            json.load(f, object_pairs_hook=check_pairs)
+
+def test_set_language_does_not_reread_config(monkeypatch, translator):
+    saved = []
+    monkeypatch.setattr(lang, '_config_cache', {'language': lang.DEFAULT_LANGUAGE})
+    monkeypatch.setattr(lang, '_read_config', lambda: pytest.fail('config re-read'))
+    monkeypatch.setattr(lang, '_save_config', lambda config: saved.append(dict(config)))
+    assert translator.set_language('de')
+    assert saved[-1]['language'] == 'de'
+
+def test_save_config_skips_unchanged_writes(monkeypatch, tmp_path):
+    config_file = tmp_path / 'config.json'
+    monkeypatch.setattr(lang, 'CONFIG_DIR', tmp_path)
+    monkeypatch.setattr(lang, 'CONFIG_FILE', config_file)
+    monkeypatch.setattr(lang, '_last_written_bytes', None)
+    monkeypatch.setattr(lang, '_config_cache', None)
+    lang._save_config({'language': 'it'})
+    assert lang._read_config() == {'language': 'it'}
+    config_file.unlink()
+    lang._save_config({'language': 'it'})
+    assert not config_file.exists()
+    lang._save_config({'language': 'fr'})
+    assert lang._read_config() == {'language': 'fr'}
+    assert lang._load_config() == {'language': 'fr'}
+
+def test_compile_template_matches_str_format():
+    for template in ('Project not found at {path}', '{a} and {b}{{literal}}', 'Pi is {pi:.2f}', 'no fields'):
+        args = {'path': '/tmp', 'a': 1, 'b': 'two', 'pi': 3.14159}
+        assert lang._compile_template(template)(args) == template.format(**args)
+
+def test_translate_keeps_template_on_missing_argument(translator):
+    assert translator.translate('project_not_found', other='x') == 'Project not found at {path}'
+
+def test_identical_short_values_share_one_object():
+    assert lang._load_lang_file('en')['btn_ok'] is lang._load_lang_file('it')['btn_ok']
+
+def test_tr_follows_language_changes(monkeypatch):
+    monkeypatch.setattr(lang, '_save_config', lambda config: None)
+    monkeypatch.setattr(lang, '_config_cache', {})
+    monkeypatch.setattr(lang.translator, '_language', lang.DEFAULT_LANGUAGE)
+    monkeypatch.setattr(lang.translator, '_translations', lang._get_translations(lang.DEFAULT_LANGUAGE))
+    assert lang.tr('menu_edit') == 'Edit'
+    assert lang.translator.set_language('it')
+    assert lang.tr('menu_edit') == 'Modifica'
+    assert lang.tr('project_not_found', path='x') == 'Progetto non trovato in x'
+
+def test_invalidate_config_cache_rereads_file(monkeypatch, tmp_path):
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"language": "es"}', encoding='utf-8')
+    monkeypatch.setattr(lang, 'CONFIG_FILE', config_file)
+    monkeypatch.setattr(lang, '_config_cache', {'language': 'en'})
+    assert lang._load_config() == {'language': 'en'}
+    lang.invalidate_config_cache()
+    assert lang._load_config() == {'language': 'es'}
+
+def test_translations_use_the_same_placeholders_as_default():
+    def fields(template):
+        return {name for _, name, _, _ in string.Formatter().parse(template) if name is not None}
+
+    default = lang._load_lang_file(lang.DEFAULT_LANGUAGE)
+    for code in lang.SUPPORTED_LANGUAGES:
+        for key, value in lang._load_lang_file(code).items():
+            if key in default:
+                assert fields(value) == fields(default[key]), (code, key)
+
+def test_corrupted_config_is_backed_up(tmp_path, monkeypatch):
+    config_file = tmp_path / 'config.json'
+    config_file.write_bytes(b'{not json')
+    monkeypatch.setattr(lang, 'CONFIG_FILE', config_file)
+    assert lang._read_config() == {}
+    assert (tmp_path / 'config.json.bak').read_bytes() == b'{not json'
+
+def test_translate_keeps_malformed_template(monkeypatch, translator):
+    monkeypatch.setitem(translator._translations, 'broken', 'Broken {')
+    assert translator.translate('broken', name='x') == 'Broken {'
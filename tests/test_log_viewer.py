@@ -0,0 +1,40 @@
+import pytest
+from struttura import log_viewer
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    path = tmp_path / 'traceback.log'
+    monkeypatch.setattr(log_viewer, 'LOG_FILE', str(path))
+    monkeypatch.setattr(log_viewer, '_log_cache', {"mtime": None, "size": None, "lines": []})
+    return path
+
+def test_load_log_lines_missing_file(log_file):
+    assert log_viewer.load_log_lines() == []
+
+def test_load_log_lines_reuses_unchanged_file(log_file):
+    log_file.write_text('[t] [INFO] one\n[t] [ERROR] two\n', encoding='utf-8')
+    lines = log_viewer.load_log_lines()
+    assert lines == ['[t] [INFO] one\n', '[t] [ERROR] two\n']
+    assert log_viewer.load_log_lines() is lines
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write('[t] [WARNING] three\n')
+    assert log_viewer.load_log_lines()[-1] == '[t] [WARNING] three\n'
+
+def test_load_log_lines_reads_only_the_tail(log_file, monkeypatch):
+    monkeypatch.setattr(log_viewer, 'MAX_LOG_BYTES', 25)
+    log_file.write_text('[t] [INFO] first line\n[t] [INFO] second\n', encoding='utf-8')
+    assert log_viewer.load_log_lines() == ['[t] [INFO] second\n']
+
+def test_load_log_lines_keeps_line_starting_at_tail(log_file, monkeypatch):
+    monkeypatch.setattr(log_viewer, 'MAX_LOG_BYTES', 19)
+    log_file.write_text('[t] [INFO] first line\n[t] [INFO] second\n', encoding='utf-8')
+    assert log_viewer.load_log_lines() == ['[t] [INFO] second\n']
+
+def test_filter_lines_by_level():
+    lines = ['[t] [INFO] one\n', '[t] [ERROR] two\n', '[t] [INFO] three\n']
+    assert log_viewer.filter_lines(lines, 'ALL') is lines
+    assert log_viewer.filter_lines(lines, 'INFO') == [lines[0], lines[2]]
+    assert log_viewer.filter_lines(lines, 'ERROR') == [lines[1]]
+    assert log_viewer.filter_lines(lines, 'WARNING') == []
+    assert log_viewer.filter_lines(lines, 'INFO') is log_viewer.filter_lines(lines, 'INFO')
+    assert log_viewer.filter_lines(list(lines[:1]), 'INFO') == [lines[0]]
@@ -1,48 +1,101 @@
+import logging
 import os
-import re
-import datetime
+import subprocess
+import sys
 import pytest
 from struttura import logger
 
-LOG_FILE = 'traceback.log'
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-def clean_log():
-    if os.path.exists(LOG_FILE):
-        os.remove(LOG_FILE)
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    path = tmp_path / 'traceback.log'
+    # Point the already-configured handler at a fresh per-test file
+    logger._handler.close()
+    monkeypatch.setattr(logger._handler, 'baseFilename', str(path))
+    monkeypatch.setattr(logger._handler, '_checked_second', None)
+    yield path
+    logger._handler.close()
 
-def read_log():
-    with open(LOG_FILE, 'r', encoding='utf-8') as f:
-        return f.read()
-
-def test_log_info_and_warning_and_error():
-    clean_log()
+def test_log_info_and_warning_and_error(log_file):
     logger.log_info('info test')
     logger.log_warning('warn test')
     logger.log_error('error test')
-    contents = read_log()
+    contents = log_file.read_text(encoding='utf-8')
     assert '[INFO] info test' in contents
     assert '[WARNING] warn test' in contents
     assert '[ERROR] error test' in contents
 
-def test_log_exception():
-    clean_log()
+def test_log_exception(log_file):
     try:
         raise ValueError('test exception')
     except Exception as e:
         logger.log_exception(type(e), e, e.__traceback__)
-    contents = read_log()
+    contents = log_file.read_text(encoding='utf-8')
     assert 'Uncaught exception:' in contents
     assert 'ValueError: test exception' in contents
 
-def test_setup_global_exception_logging(monkeypatch):
-    clean_log()
+def test_setup_global_exception_logging(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, 'excepthook', sys.excepthook)
     logger.setup_global_exception_logging()
-    # Simulate uncaught exception
+    assert sys.excepthook is logger.log_exception
+    # Simulate uncaught exception in a child process writing to tmp_path
     code = 'import struttura.logger\nstruttura.logger.setup_global_exception_logging()\nraise RuntimeError(\'uncaught!\')'
-    import subprocess
-    result = subprocess.run(['python', '-c', code], capture_output=True, text=True)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=tmp_path, env=env)
     # Should log the uncaught exception
-    assert os.path.exists(LOG_FILE)
-    contents = read_log()
+    contents = (tmp_path / 'traceback.log').read_text(encoding='utf-8')
     assert 'Uncaught exception:' in contents
     assert 'RuntimeError: uncaught!' in contents
+
+def test_traceback_module_logs_through_logger(log_file):
+    from struttura import traceback as tb_logger
+    try:
+        raise KeyError('from traceback module')
+    except Exception as e:
+        tb_logger.log_exception(type(e), e, e.__traceback__)
+    contents = log_file.read_text(encoding='utf-8')
+    assert '[ERROR] Uncaught exception:' in contents
+    assert "KeyError: 'from traceback module'" in contents
+
+def _record(message, created):
+    record = logging.LogRecord('struttura.logger', logging.INFO, __file__, 0, message, None, None)
+    record.created = created
+    return record
+
+def test_log_file_is_reopened_after_delete(log_file):
+    logger._handler.handle(_record('before delete', 1000.0))
+    log_file.unlink()
+    logger._handler.handle(_record('after delete', 1001.0))
+    contents = log_file.read_text(encoding='utf-8')
+    assert 'after delete' in contents
+    assert 'before delete' not in contents
+
+def test_reopen_check_runs_once_per_second(log_file, monkeypatch):
+    logger._handler.handle(_record('first', 1000.0))
+    calls = []
+    real_fstat = os.fstat
+    monkeypatch.setattr(logger.os, 'fstat', lambda fd: calls.append(fd) or real_fstat(fd))
+    logger._handler.handle(_record('same second', 1000.5))
+    assert calls == []
+    logger._handler.handle(_record('next second', 1001.0))
+    assert len(calls) == 1
+
+def test_log_file_rotates_at_max_bytes(log_file, monkeypatch):
+    monkeypatch.setattr(logger._handler, 'maxBytes', 200)
+    for i in range(10):
+        logger.log_info(f'rotation entry {i} ' + 'x' * 40)
+    rotated = log_file.with_name('traceback.log.1')
+    assert rotated.exists()
+    assert 'rotation entry 9' in log_file.read_text(encoding='utf-8')
+    assert log_file.stat().st_size <= 200
+
+def test_timestamp_is_reused_within_a_second(monkeypatch):
+    monkeypatch.setattr(logger, '_timestamp_cache', (None, ''))
+    formatter = logger._handler.formatter
+    first = formatter.formatTime(_record('a', 2000.1))
+    same_second = formatter.formatTime(_record('b', 2000.9))
+    next_second = formatter.formatTime(_record('c', 2001.0))
+    assert same_second is first
+    assert next_second is not first
+    assert next_second != first
@@ -21,28 +21,30 @@ def move_files():
         shutil.move(str(py_file), str(dest))
         print(f"Moved {py_file} to {dest}")
 
+# 'from app.module import' -> 'from module import' and
+# 'import app.module' -> 'import module', in one pass
+IMPORT_RE = re.compile(r'from\s+app\.(\w+)\s+import|import\s+app\.(\w+)')
+
+def _replace_import(match):
+    app_from, app_import = match.groups()
+    if app_from:
+        return f'from {app_from} import'
+    return f'import {app_import}'
+
 def update_imports_in_file(file_path):
     """Update import statements in a Python file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Update imports like 'from app.module' to 'from module'
-    updated_content = re.sub(
-        r'from\s+app\.(\w+)\s+import',
-        r'from \1 import',
-        content
-    )
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    # Both imports contain 'app.'; skip files without it before decoding
+    if b'app.' not in data:
+        return
+    content = data.decode('utf-8')
     
-    # Update imports like 'import app.module' to 'import module'
-    updated_content = re.sub(
-        r'import\s+app\.(\w+)',
-        r'import \1',
-        updated_content
-    )
+    updated_content = IMPORT_RE.sub(_replace_import, content)
     
     if updated_content != content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        with open(file_path, 'wb') as f:
+            f.write(updated_content.encode('utf-8'))
         print(f"Updated imports in {file_path}")
 
 def update_all_imports():
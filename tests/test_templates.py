@@ -0,0 +1,37 @@
+import pytest
+from struttura.templates import template_manager
+
+@pytest.mark.parametrize('name', ['basic', 'cli', 'web', 'data-science'])
+def test_template_creates_package(tmp_path, name):
+    assert template_manager.create_from_template(name, str(tmp_path), 'mypkg')
+    assert (tmp_path / 'mypkg' / '__init__.py').read_text().startswith('"""mypkg package."""')
+    setup_py = (tmp_path / 'setup.py').read_text()
+    assert 'name="mypkg"' in setup_py
+    compile(setup_py, 'setup.py', 'exec')
+    assert (tmp_path / 'README.md').read_text().startswith('# mypkg\n')
+    assert 'import mypkg' in (tmp_path / 'tests' / 'test_basic.py').read_text()
+
+def test_cli_template_adds_click(tmp_path):
+    assert template_manager.create_from_template('cli', str(tmp_path), 'mypkg')
+    assert '"""mypkg - A command-line interface."""' in (tmp_path / 'mypkg' / 'cli.py').read_text()
+    assert "click.echo(f'Hello, {name}!')" in (tmp_path / 'mypkg' / 'cli.py').read_text()
+    assert 'from .cli import cli' in (tmp_path / 'mypkg' / '__init__.py').read_text()
+    assert 'install_requires=["click>=7.0"]' in (tmp_path / 'setup.py').read_text()
+    assert '"mypkg=mypkg.cli:cli"' in (tmp_path / 'setup.py').read_text()
+    assert 'mypkg --help' in (tmp_path / 'README.md').read_text()
+
+def test_web_template_fills_in_readme(tmp_path):
+    assert template_manager.create_from_template('web', str(tmp_path), 'mypkg')
+    assert 'install_requires=["flask>=2.0.0"]' in (tmp_path / 'setup.py').read_text()
+    assert 'FLASK_APP=mypkg.app:create_app' in (tmp_path / 'README.md').read_text()
+    assert '{% block content %}' in (tmp_path / 'mypkg' / 'templates' / 'base.html').read_text()
+
+def test_data_science_template_layout(tmp_path):
+    assert template_manager.create_from_template('data-science', str(tmp_path), 'mypkg')
+    for rel in ('data/raw', 'data/processed', 'data/external', 'notebooks',
+                'src/data', 'src/features', 'src/models', 'src/visualization'):
+        assert (tmp_path / rel).is_dir(), rel
+    assert 'pandas' in (tmp_path / 'requirements.txt').read_text()
+    assert 'packages=find_packages() + ["src"]' in (tmp_path / 'setup.py').read_text()
+    assert '## Data Science Project' in (tmp_path / 'README.md').read_text()
+    assert '__pycache__/' in (tmp_path / '.gitignore').read_text()